@@ -2,12 +2,26 @@ import sqlite3
 import os
 import sys
 import shutil
+import threading
+import functools
+import contextlib
 
-# Define the name of our database file
+# Name of the per-user folder that holds the database
 APP_NAME = "AttendanceLogger"
 
+# Hot read queries. The connection's statement cache is keyed by SQL text, so
+# sharing one string per query means every call reuses the compiled statement.
+GET_ALL_SETTINGS_SQL = "SELECT key, value FROM settings"
+GET_LOG_BY_DATE_SQL = "SELECT * FROM attendance_logs WHERE date = ?"
+GET_LOGS_IN_RANGE_SQL = "SELECT * FROM attendance_logs WHERE date BETWEEN ? AND ? ORDER BY date ASC"
+GET_HOLIDAYS_IN_RANGE_SQL = "SELECT * FROM holidays WHERE holiday_date BETWEEN ? AND ? ORDER BY holiday_date ASC"
+
+@functools.lru_cache(maxsize=1)
 def get_db_path():
-    """Returns the persistent path for the database, copying from bundled copy if needed."""
+    """
+    Returns the persistent path for the database, copying from bundled copy if needed.
+    The result is cached, so the directory checks and copy only happen on the first call.
+    """
     # Where the DB should live (persistent location)
     local_appdata = os.getenv("LOCALAPPDATA") or os.path.expanduser("~")
     db_dir = os.path.join(local_appdata, APP_NAME)
@@ -22,27 +36,117 @@ def get_db_path():
         else:
             base_dir = os.path.dirname(os.path.abspath(__file__))
         bundled_db = os.path.join(base_dir, "attendance.db")
-        shutil.copyfile(bundled_db, db_path)
+        # With no bundled copy there is nothing to copy: sqlite creates the file on
+        # connect and initialize_database() builds the schema. copyfile already uses
+        # the OS zero-copy path; a hard link is avoided because writes to the live DB
+        # would then also modify the bundled template.
+        if os.path.exists(bundled_db):
+            shutil.copyfile(bundled_db, db_path)
 
     return db_path
 def get_db_connection():
     """Establishes and returns a connection to the SQLite database."""
-    DB_NAME = get_db_path()
-    conn = sqlite3.connect(DB_NAME)
+    # The connection compiles each distinct SQL string once and reuses the prepared
+    # statement afterwards; the default cache (128) already covers every query in this module
+    conn = sqlite3.connect(get_db_path())
     # Set row_factory to sqlite3.Row to allow accessing columns by name
     conn.row_factory = sqlite3.Row
+    # Per-connection tuning: no fsync on every commit under WAL, temp data and
+    # a 64 MB page cache kept in memory, and memory-mapped reads
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA mmap_size=268435456")
     return conn
 
+# One persistent connection per thread, opened lazily and kept for the app's lifetime
+_local = threading.local()
+
+def _get_conn():
+    """Returns the calling thread's persistent connection, opening it on first use."""
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = get_db_connection()
+        _local.conn = conn
+    return conn
+
+def close_connection():
+    """Closes the calling thread's persistent connection, if one is open."""
+    conn = getattr(_local, 'conn', None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
+@contextlib.contextmanager
+def transaction():
+    """
+    Runs the enclosed database calls as one transaction on the calling thread's
+    connection: committed once on success, rolled back if the block raises.
+    Nested uses join the outermost transaction, so callers can wrap several
+    write helpers in `with transaction():` to get a single commit. The helpers'
+    table version bumps are held back until that outermost block ends.
+    """
+    conn = _get_conn()
+    depth = getattr(_local, 'tx_depth', 0)
+    if not depth:
+        _local.pending_writes = set()
+    _local.tx_depth = depth + 1
+    try:
+        if depth:
+            yield conn
+        else:
+            with conn:
+                yield conn
+    finally:
+        _local.tx_depth = depth
+        if not depth:
+            # The writes are only committed (or rolled back) now, so this is when
+            # caches keyed on the table versions may be dropped: on either path
+            pending, _local.pending_writes = _local.pending_writes, set()
+            for table in pending:
+                _apply_write(table)
+
+# Per-table write counters, incremented once a write to that table has been
+# committed (or rolled back) so callers can cache results keyed on them
+_table_versions = {'attendance_logs': 0, 'holidays': 0, 'settings': 0}
+
+def get_table_version(table):
+    """Returns a counter that changes whenever the given table is written."""
+    return _table_versions[table]
+
+def _bump_version(table):
+    _table_versions[table] += 1
+
+def _apply_write(table):
+    """Bumps a table's version (for settings, also dropping the settings cache)."""
+    if table == 'settings':
+        invalidate_settings_cache()
+    else:
+        _bump_version(table)
+
+def _note_write(table):
+    """
+    Records a write to a table. Called by the write helpers after their transaction()
+    block; inside an enclosing transaction the version bump waits until it ends.
+    """
+    if getattr(_local, 'tx_depth', 0):
+        _local.pending_writes.add(table)
+    else:
+        _apply_write(table)
+
 def initialize_database():
     """
     Initializes the database by creating tables and inserting default settings
     if they don't already exist.
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    conn = _get_conn()
+
+    # WAL lets readers run alongside the writer; the mode is stored in the
+    # database file itself, so it only needs to be set once here
+    conn.execute("PRAGMA journal_mode=WAL")
 
     # 1. Create 'settings' table
-    cursor.execute('''
+    conn.execute('''
         CREATE TABLE IF NOT EXISTS settings (
             key TEXT PRIMARY KEY NOT NULL,
             value TEXT
@@ -50,7 +154,7 @@ def initialize_database():
     ''')
 
     # 2. Create 'attendance_logs' table
-    cursor.execute('''
+    conn.execute('''
         CREATE TABLE IF NOT EXISTS attendance_logs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             date TEXT NOT NULL UNIQUE, -- YYYY-MM-DD
@@ -60,7 +164,7 @@ def initialize_database():
     ''')
 
     # 3. Create 'holidays' table
-    cursor.execute('''
+    conn.execute('''
         CREATE TABLE IF NOT EXISTS holidays (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             holiday_date TEXT NOT NULL UNIQUE, -- YYYY-MM-DD
@@ -68,189 +172,291 @@ def initialize_database():
         )
     ''')
 
+    # 4. Covering indexes for the date-range queries, so they are answered
+    # (already sorted) from the index without a table lookup per row
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_date_cover ON attendance_logs (date, time_in, time_out)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_hol_date_cover ON holidays (holiday_date, description)")
+
     # Insert default settings if they don't exist
     # Using INSERT OR IGNORE will prevent errors if the keys already exist
     INSERT_OR_IGNORE_SETTING_SQL = "INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)"
-    cursor.execute(INSERT_OR_IGNORE_SETTING_SQL, ('fixed_monthly_salary', '0'))
-    cursor.execute(INSERT_OR_IGNORE_SETTING_SQL, ('hourly_rate', '0'))
-    cursor.execute(INSERT_OR_IGNORE_SETTING_SQL, ('month_start_day', '29'))
-    cursor.execute(INSERT_OR_IGNORE_SETTING_SQL, ('month_end_day', '28'))
-    cursor.execute(INSERT_OR_IGNORE_SETTING_SQL, ('per_day_salary', '0'))
-    cursor.execute(INSERT_OR_IGNORE_SETTING_SQL, ('half_day_salary', '0'))
+    conn.executemany(INSERT_OR_IGNORE_SETTING_SQL, [
+        ('fixed_monthly_salary', '0'),
+        ('hourly_rate', '0'),
+        ('month_start_day', '29'),
+        ('month_end_day', '28'),
+        ('per_day_salary', '0'),
+        ('half_day_salary', '0'),
+    ])
     conn.commit()
-    conn.close()
+    invalidate_settings_cache()
 
 # --- Functions for Settings Management ---
 
+# The whole settings table (key -> value), loaded with one query on first use
+# and dropped whenever a setting is written
+_settings_cache = None
+# Guards filling and dropping the cache, which happen on different threads
+_settings_lock = threading.Lock()
+
+def _load_settings():
+    """Returns the cached settings dict, reading the table if it isn't loaded yet."""
+    global _settings_cache
+    settings = _settings_cache
+    if settings is None:
+        version = _table_versions['settings']
+        settings = {row['key']: row['value'] for row in _get_conn().execute(GET_ALL_SETTINGS_SQL)}
+        with _settings_lock:
+            # A write invalidated the cache while this read ran; its result may be stale, so don't keep it
+            if _table_versions['settings'] == version:
+                _settings_cache = settings
+    return settings
+
+def invalidate_settings_cache():
+    """Drops the cached settings so the next read goes back to the database, and bumps the settings version."""
+    global _settings_cache
+    with _settings_lock:
+        _bump_version('settings')
+        _settings_cache = None
+
 def get_setting(key):
-    """Retrieves a setting's value from the database."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
-    result = cursor.fetchone()
-    conn.close()
-    return result['value'] if result else " "
+    """Retrieves a setting's value. Values are cached until the next update_setting()."""
+    return _load_settings().get(key, " ")
+
+def get_settings(keys):
+    """Retrieves several settings at once as a {key: value} dict."""
+    settings = _load_settings()
+    return {key: settings.get(key, " ") for key in keys}
 
 def update_setting(key, value):
     """Inserts or updates a setting's value in the database."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    # INSERT OR REPLACE will insert if key doesn't exist, otherwise update
-    cursor.execute("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, str(value)))
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        # INSERT OR REPLACE will insert if key doesn't exist, otherwise update
+        conn.execute("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, str(value)))
+    _note_write('settings')
+
+def update_settings(values):
+    """Inserts or updates several settings ({key: value}) with a single commit."""
+    with transaction() as conn:
+        conn.executemany("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                         [(key, str(value)) for key, value in values.items()])
+    _note_write('settings')
 
 # --- Functions for Attendance Logs ---
 
 def insert_attendance_log(date_str, time_in_str):
     """Inserts a new attendance log for a given date and time_in."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    try:
-        cursor.execute("INSERT INTO attendance_logs (date, time_in) VALUES (?, ?)",
-                       (date_str, time_in_str))
-        conn.commit()
-        return True
-    except sqlite3.IntegrityError:
-        # This means a record for this date already exists (due to UNIQUE constraint)
-        return False
-    finally:
-        conn.close()
+    with transaction() as conn:
+        # A record for this date may already exist (UNIQUE constraint). ON CONFLICT DO NOTHING
+        # skips it without raising, and RETURNING only yields a row when one was inserted.
+        inserted = conn.execute("INSERT INTO attendance_logs (date, time_in) VALUES (?, ?) "
+                                "ON CONFLICT(date) DO NOTHING RETURNING id",
+                                (date_str, time_in_str)).fetchone() is not None
+    if inserted:
+        _note_write('attendance_logs')
+    return inserted
+
+def insert_attendance_logs_bulk(rows):
+    """
+    Inserts many (date, time_in, time_out) logs in a single transaction.
+    Dates that already have a log are skipped. Returns the number of rows inserted.
+    """
+    conn = _get_conn()
+    changes_before = conn.total_changes
+    with transaction():
+        conn.executemany("INSERT OR IGNORE INTO attendance_logs (date, time_in, time_out) VALUES (?, ?, ?)",
+                         rows)
+    inserted = conn.total_changes - changes_before
+    if inserted:
+        _note_write('attendance_logs')
+    return inserted
 
 def get_attendance_log_by_date(date_str):
     """Retrieves an attendance log for a specific date."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM attendance_logs WHERE date = ?", (date_str,))
-    record = cursor.fetchone()
-    conn.close()
-    return record # Returns a sqlite3.Row object or None
+    conn = _get_conn()
+    return conn.execute(GET_LOG_BY_DATE_SQL, (date_str,)).fetchone() # Returns a sqlite3.Row object or None
+
+def update_log(date_str, time_in_str=None, time_out_str=None, clear_time_out=False):
+    """
+    Updates an existing attendance log with one parameterized UPDATE.
+    A time passed as None is left as-is; set clear_time_out to reset time_out to NULL.
+    """
+    with transaction() as conn:
+        updated = conn.execute("UPDATE attendance_logs SET time_in = COALESCE(?, time_in), "
+                               "time_out = CASE WHEN ? THEN NULL ELSE COALESCE(?, time_out) END WHERE date = ?",
+                               (time_in_str, clear_time_out, time_out_str, date_str)).rowcount
+    if updated:
+        _note_write('attendance_logs')
 
 def update_attendance_log_out_time(date_str, time_out_str):
-    """Updates the time_out for an existing attendance log."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("UPDATE attendance_logs SET time_out = ? WHERE date = ?",
-                   (time_out_str, date_str))
-    conn.commit()
-    conn.close()
+    """Updates the time_out for an existing attendance log (None clears it)."""
+    update_log(date_str, time_out_str=time_out_str, clear_time_out=time_out_str is None)
+
+def clear_attendance_log_out_time(date_str):
+    """Clears a log's time_out if it is set. Returns True if a log was changed."""
+    with transaction() as conn:
+        # RETURNING only yields a row when the WHERE matched, so this needs no prior SELECT
+        cleared = conn.execute("UPDATE attendance_logs SET time_out = NULL "
+                               "WHERE date = ? AND time_out IS NOT NULL RETURNING id",
+                               (date_str,)).fetchone() is not None
+    if cleared:
+        _note_write('attendance_logs')
+    return cleared
+
+def close_attendance_log(date_str, time_out_str):
+    """Sets time_out on a log that has an IN time. Returns False if there is no such log."""
+    with transaction() as conn:
+        closed = conn.execute("UPDATE attendance_logs SET time_out = ? "
+                              "WHERE date = ? AND time_in IS NOT NULL AND time_in <> '' RETURNING id",
+                              (time_out_str, date_str)).fetchone() is not None
+    if closed:
+        _note_write('attendance_logs')
+    return closed
 
 def update_attendance_log_times(date_str, time_in_str, time_out_str):
-    """Updates both time_in and time_out for an existing attendance log."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("UPDATE attendance_logs SET time_in = ?, time_out = ? WHERE date = ?",
-                   (time_in_str, time_out_str, date_str))
-    conn.commit()
-    conn.close()
+    """Updates both time_in and time_out for an existing attendance log (a None time_out clears it)."""
+    update_log(date_str, time_in_str, time_out_str, clear_time_out=time_out_str is None)
+
+def upsert_clock(date_str, time_in_str, time_out_str=None):
+    """
+    Sets time_in and time_out for a date in a single statement, inserting the
+    log if none exists yet or overwriting both times if it does.
+    """
+    with transaction() as conn:
+        conn.execute("INSERT INTO attendance_logs (date, time_in, time_out) VALUES (?, ?, ?) "
+                     "ON CONFLICT(date) DO UPDATE SET time_in = excluded.time_in, time_out = excluded.time_out",
+                     (date_str, time_in_str, time_out_str))
+    _note_write('attendance_logs')
+
+def upsert_attendance_logs_bulk(rows):
+    """
+    Writes many (date, time_in, time_out) logs in a single transaction, inserting
+    new dates and overwriting both times on dates that already have a log.
+    """
+    with transaction() as conn:
+        conn.executemany("INSERT INTO attendance_logs (date, time_in, time_out) VALUES (?, ?, ?) "
+                         "ON CONFLICT(date) DO UPDATE SET time_in = excluded.time_in, time_out = excluded.time_out",
+                         rows)
+    _note_write('attendance_logs')
 
 def get_attendance_logs_in_range(start_date_str, end_date_str):
     """Retrieves all attendance logs within a specified date range (inclusive)."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM attendance_logs WHERE date BETWEEN ? AND ? ORDER BY date ASC",
-                   (start_date_str, end_date_str))
-    records = cursor.fetchall()
-    conn.close()
-    return records # Returns a list of sqlite3.Row objects
+    conn = _get_conn()
+    return conn.execute(GET_LOGS_IN_RANGE_SQL, (start_date_str, end_date_str)).fetchall() # Returns a list of sqlite3.Row objects
+
+def get_attendance_logs_last_n_days(days):
+    """
+    Retrieves attendance logs from 'days' days ago up to today (inclusive).
+    The date bounds are computed by SQLite, using local time to match datetime.date.today().
+    """
+    conn = _get_conn()
+    return conn.execute("SELECT * FROM attendance_logs "
+                        "WHERE date BETWEEN date('now', 'localtime', ?) AND date('now', 'localtime') "
+                        "ORDER BY date ASC",
+                        (f'-{int(days)} days',)).fetchall() # Returns a list of sqlite3.Row objects
 
 # --- Functions for Holidays ---
 
 def insert_holiday(holiday_date_str, description=""):
     """Inserts a new holiday record."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    try:
-        cursor.execute("INSERT INTO holidays (holiday_date, description) VALUES (?, ?)",
-                       (holiday_date_str, description))
-        conn.commit()
-        return True
-    except sqlite3.IntegrityError:
-        # Holiday for this date already exists
-        return False
-    finally:
-        conn.close()
+    with transaction() as conn:
+        # No row is returned if a holiday for this date already exists
+        inserted = conn.execute("INSERT INTO holidays (holiday_date, description) VALUES (?, ?) "
+                                "ON CONFLICT(holiday_date) DO NOTHING RETURNING id",
+                                (holiday_date_str, description)).fetchone() is not None
+    if inserted:
+        _note_write('holidays')
+    return inserted
+
+def insert_holidays_bulk(pairs):
+    """
+    Inserts many (holiday_date, description) records in a single transaction.
+    Dates that already have a holiday are skipped. Returns the number of rows inserted.
+    """
+    conn = _get_conn()
+    changes_before = conn.total_changes
+    with transaction():
+        conn.executemany("INSERT OR IGNORE INTO holidays (holiday_date, description) VALUES (?, ?)",
+                         pairs)
+    inserted = conn.total_changes - changes_before
+    if inserted:
+        _note_write('holidays')
+    return inserted
 
 def get_holidays_in_range(start_date_str, end_date_str):
     """Retrieves all holidays within a specified date range (inclusive)."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM holidays WHERE holiday_date BETWEEN ? AND ? ORDER BY holiday_date ASC",
-                   (start_date_str, end_date_str))
-    records = cursor.fetchall()
-    conn.close()
-    return records # Returns a list of sqlite3.Row objects
+    conn = _get_conn()
+    return conn.execute(GET_HOLIDAYS_IN_RANGE_SQL, (start_date_str, end_date_str)).fetchall() # Returns a list of sqlite3.Row objects
+
+def holiday_exists(holiday_date_str):
+    """Returns True if a holiday is recorded for the given date."""
+    conn = _get_conn()
+    return conn.execute("SELECT 1 FROM holidays WHERE holiday_date = ? LIMIT 1",
+                        (holiday_date_str,)).fetchone() is not None
+
+def get_period_bundle(start_date_str, end_date_str):
+    """
+    Fetches both the attendance logs and the holidays for a date range (inclusive)
+    on the same connection, keyed by date: ({date: log_row}, {holiday_date: description}).
+    """
+    conn = _get_conn()
+    logs = {log['date']: log for log in conn.execute(GET_LOGS_IN_RANGE_SQL, (start_date_str, end_date_str))}
+    holidays = {h['holiday_date']: h['description']
+                for h in conn.execute(GET_HOLIDAYS_IN_RANGE_SQL, (start_date_str, end_date_str))}
+    return logs, holidays
 
 def delete_holiday(holiday_date_str):
     """Deletes a holiday record for a specific date."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM holidays WHERE holiday_date = ?", (holiday_date_str,))
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        deleted = conn.execute("DELETE FROM holidays WHERE holiday_date = ?", (holiday_date_str,)).rowcount
+    if deleted:
+        _note_write('holidays')
 
 
 def update_attendance_log(date, time_in, time_out):
     """Updates an existing attendance log entry for a specific date."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("UPDATE attendance_logs SET time_in=?, time_out=? WHERE date=?",
-                   (time_in, time_out, date))
-    conn.commit()
-    conn.close()
+    update_attendance_log_times(date, time_in, time_out)
 
 def delete_attendance_log(date):
     """Deletes an attendance log entry for a specific date."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM attendance_logs WHERE date=?", (date,))
-    conn.commit()
-    conn.close()
+    with transaction() as conn:
+        deleted = conn.execute("DELETE FROM attendance_logs WHERE date=?", (date,)).rowcount
+    if deleted:
+        _note_write('attendance_logs')
+
+def delete_attendance_logs(dates):
+    """Deletes the attendance logs for several dates in a single transaction. Returns the number deleted."""
+    conn = _get_conn()
+    changes_before = conn.total_changes
+    with transaction():
+        conn.executemany("DELETE FROM attendance_logs WHERE date=?", [(date,) for date in dates])
+    deleted = conn.total_changes - changes_before
+    if deleted:
+        _note_write('attendance_logs')
+    return deleted
 
-# You should already have this function, but just in case:
 def get_all_attendance_logs():
-    """Fetches all attendance logs from the database."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT date, time_in, time_out FROM attendance_logs ORDER BY date DESC")
-    logs = cursor.fetchall()
-    conn.close()
-    
-    logs_list = []
-    for log in logs:
-        logs_list.append({
-            'date': log[0],
-            'time_in': log[1],
-            'time_out': log[2],
-        })
-    return logs_list
-
-
-
-def get_attendance_logs_in_range_for_edittab(start_date, end_date):
-    """Fetches attendance logs within a specified date range."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute("SELECT date, time_in, time_out FROM attendance_logs WHERE date BETWEEN ? AND ? ORDER BY date ASC",
-                   (start_date, end_date))
-    logs = cursor.fetchall()
-    conn.close()
-    
-    logs_list = []
-    for log in logs:
-        logs_list.append({
-            'date': log[0],
-            'time_in': log[1],
-            'time_out': log[2],
-        })
-    return logs_list
+    """Fetches all attendance logs from the database, newest first."""
+    conn = _get_conn()
+    return conn.execute("SELECT date, time_in, time_out FROM attendance_logs ORDER BY date DESC").fetchall() # Returns a list of sqlite3.Row objects (log['date'] etc. still work)
+
+
+
+def get_attendance_logs_in_range_for_edittab(start_date, end_date, limit=-1, after_date=None):
+    """
+    Fetches attendance logs within a specified date range.
+    For paging, pass limit (at most that many logs) and after_date (the last date
+    already fetched); pages are keyed on the indexed date, not on an OFFSET.
+    """
+    conn = _get_conn()
+    return conn.execute("SELECT date, time_in, time_out FROM attendance_logs "
+                        "WHERE date BETWEEN ? AND ? AND date > ? ORDER BY date ASC LIMIT ?",
+                        (start_date, end_date, after_date or '', limit)).fetchall() # Returns a list of sqlite3.Row objects
 
 def add_attendance_log(date, time_in, time_out):
     """Adds a new attendance log entry."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("INSERT INTO attendance_logs (date, time_in, time_out) VALUES (?, ?, ?)",
-                   (date, time_in, time_out))
-    conn.commit()
-    conn.close()
+    # Raises sqlite3.IntegrityError (after rolling back) if a log for this date already exists
+    with transaction() as conn:
+        conn.execute("INSERT INTO attendance_logs (date, time_in, time_out) VALUES (?, ?, ?)",
+                     (date, time_in, time_out))
+    _note_write('attendance_logs')
@@ -1,18 +1,50 @@
 import calendar
+import collections
 
-from numpy import half
 import database_manager
 import datetime
+import functools
+import re
 import sqlite3
+
+# Time format accepted when editing attendance entries (HH:MM:SS, 00:00:00 to 23:59:59)
+_TIME_PATTERN = re.compile(r'^([01]\d|2[0-3]):[0-5]\d:[0-5]\d$')
+
 # --- Helper Functions for Dates and Times ---
 
 def get_current_date_str():
     """Returns today's date in YYYY-MM-DD string format."""
-    return datetime.date.today().strftime('%Y-%m-%d')
+    return datetime.date.today().isoformat()
 
 def get_current_time_str():
-    """Returns the current time in HH:MM:SS string format."""
-    return datetime.datetime.now().strftime('%H:%M')
+    """Returns the current time in HH:MM string format."""
+    return datetime.datetime.now().time().isoformat(timespec='minutes')
+
+# Parsed settings, memoized on the settings table version so they are only
+# re-read and re-parsed after a setting is written
+@functools.lru_cache(maxsize=1)
+def _period_day_settings(settings_version):
+    """Returns (month_start_day, month_end_day) as ints. Raises ValueError if malformed."""
+    settings = database_manager.get_settings(('month_start_day', 'month_end_day'))
+    month_start_day_raw = settings['month_start_day']
+    month_end_day_raw = settings['month_end_day']
+    month_start_day = int(month_start_day_raw) if month_start_day_raw is not None else 28
+    month_end_day = int(month_end_day_raw) if month_end_day_raw is not None else 27
+    return month_start_day, month_end_day
+
+@functools.lru_cache(maxsize=1)
+def _salary_settings(settings_version):
+    """
+    Returns (fixed_monthly_salary, hourly_rate, per_day_salary, half_day_salary)
+    as floats, all 0.0 if any of them is missing or malformed.
+    """
+    settings = database_manager.get_settings(
+        ('fixed_monthly_salary', 'hourly_rate', 'per_day_salary', 'half_day_salary'))
+    try:
+        return (float(settings['fixed_monthly_salary']), float(settings['hourly_rate']),
+                float(settings['per_day_salary']), float(settings['half_day_salary']))
+    except (ValueError, TypeError):
+        return 0.0, 0.0, 0.0, 0.0
 
 def get_start_end_dates_for_period(date_to_use=None):
     """
@@ -20,24 +52,60 @@ def get_start_end_dates_for_period(date_to_use=None):
     attendance period based on configured month_start_day and month_end_day.
     Uses the 28th to 27th rollover logic.
     """
-    # Get settings from database, convert to int, use defaults if None
-    month_start_day_raw = database_manager.get_setting('month_start_day')
-    month_end_day_raw = database_manager.get_setting('month_end_day')
-    month_start_day = int(month_start_day_raw) if month_start_day_raw is not None else 28
-    month_end_day = int(month_end_day_raw) if month_end_day_raw is not None else 27
-    
+    month_start_day, month_end_day = _period_day_settings(
+        database_manager.get_table_version('settings'))
+
     if date_to_use is None:
-        base_date = datetime.date.today()
+        return _compute_period(datetime.date.today(), True, month_start_day, month_end_day)
+    return _compute_period(date_to_use, False, month_start_day, month_end_day)
+
+@functools.lru_cache(maxsize=64)
+def _compute_period(base_date, until_yesterday, month_start_day, month_end_day):
+    """
+    Computes the (start, end) date strings of the period containing base_date.
+    The period ends yesterday when until_yesterday is set, otherwise on month_end_day.
+    Memoized: the result only depends on the arguments, settings included.
+    Start/end days past the end of a short month are clamped to its last day.
+    """
+    year, month = base_date.year, base_date.month
+    if until_yesterday:
         end_date = base_date - datetime.timedelta(days=1)
     else:
-        base_date = date_to_use
-        end_date = base_date.replace(day=month_end_day)
+        end_date = datetime.date(year, month, min(month_end_day, _days_in_month(year, month)))
 
-    prev_month = base_date.replace(day=1) - datetime.timedelta(days=1)
-    start_date = prev_month.replace(day=month_start_day)
+    # The period starts in the month before base_date's
+    start_year, start_month = (year - 1, 12) if month == 1 else (year, month - 1)
+    start_date = datetime.date(start_year, start_month,
+                               min(month_start_day, _days_in_month(start_year, start_month)))
 
+    return start_date.isoformat(), end_date.isoformat()
 
-    return start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
+# Times are stored as 'HH:MM' text; these convert at the boundary so the
+# arithmetic works on integer seconds since midnight.
+def time_to_seconds(time_str):
+    """
+    Converts an 'HH:MM' or 'HH:MM:SS' string (edited entries carry seconds)
+    to seconds since midnight. Raises ValueError if malformed.
+    """
+    parts = time_str.split(':')
+    if len(parts) not in (2, 3):
+        raise ValueError(f"Invalid time: {time_str!r}")
+    hours, minutes = int(parts[0]), int(parts[1])
+    seconds = int(parts[2]) if len(parts) == 3 else 0
+    if not (0 <= hours < 24 and 0 <= minutes < 60 and 0 <= seconds < 60):
+        raise ValueError(f"Invalid time: {time_str!r}")
+    return hours * 3600 + minutes * 60 + seconds
+
+def minutes_to_hhmm(minutes):
+    """Formats minutes since midnight as an 'HH:MM' string."""
+    hours, minutes = divmod(minutes % 1440, 60)
+    return f"{hours:02d}:{minutes:02d}"
+
+def _days_in_month(year, month):
+    """Returns the number of days in the given month, accounting for leap years."""
+    if month == 2 and calendar.isleap(year):
+        return 29
+    return _DAYS_IN_MONTH[month]
 
 def get_total_hours_worked(time_in_str, time_out_str):
     """
@@ -48,22 +116,25 @@ def get_total_hours_worked(time_in_str, time_out_str):
     if not time_in_str or not time_out_str:
         return 0.0
 
-    FMT = '%H:%M'
-    t_in = datetime.datetime.strptime(time_in_str, FMT).time()
-    t_out = datetime.datetime.strptime(time_out_str, FMT).time()
+    tin = time_to_seconds(time_in_str)
+    tout = time_to_seconds(time_out_str)
+    # An OUT before the IN is an overnight shift (e.g., In 22:00, Out 06:00 next day)
+    return (tout - tin + (86400 if tout < tin else 0)) / 3600.0
 
-    dummy_date = datetime.date(1, 1, 1) # A dummy date for datetime object creation
-    dt_in = datetime.datetime.combine(dummy_date, t_in)
-    dt_out = datetime.datetime.combine(dummy_date, t_out)
-
-    if dt_out < dt_in:
-        # Handles overnight shifts (e.g., In 22:00:00, Out 06:00:00 next day)
-        dt_out += datetime.timedelta(days=1)
+# --- Attendance Logging Logic ---
 
-    duration = dt_out - dt_in
-    return duration.total_seconds() / 3600.0 # Convert seconds to hours
+@functools.lru_cache(maxsize=1)
+def _today_record(today_str, attendance_version):
+    """Reads a day's log; cached until the date or the attendance version changes."""
+    return database_manager.get_attendance_log_by_date(today_str)
 
-# --- Attendance Logging Logic ---
+def get_today():
+    """
+    Returns (today's YYYY-MM-DD string, today's log row or None).
+    The row is only re-read from the database after an attendance write.
+    """
+    today_str = get_current_date_str()
+    return today_str, _today_record(today_str, database_manager.get_table_version('attendance_logs'))
 
 def handle_app_startup_in_log():
     """
@@ -72,18 +143,14 @@ def handle_app_startup_in_log():
     - If 'In' already recorded and 'Out' was set, clears 'Out' to extend session.
     """
     today_str = get_current_date_str()
-    current_time_str = get_current_time_str()
-    
-    today_record = database_manager.get_attendance_log_by_date(today_str)
 
-    if not today_record:
-        # No record for today, insert new 'In'
-        database_manager.insert_attendance_log(today_str, current_time_str)
-        return "Logged IN automatically for today."
-    elif today_record['time_out'] is not None:
-        # Record exists, and 'Out' was set. Clear 'Out' as user is back 'In'.
-        database_manager.update_attendance_log_out_time(today_str, None) # Set time_out to NULL
+    # Each write reports whether it matched, so no SELECT is needed first
+    if database_manager.clear_attendance_log_out_time(today_str):
+        # Record exists, and 'Out' was set. Cleared as user is back 'In'.
         return "You are back IN. Previous OUT time cleared."
+    elif database_manager.insert_attendance_log(today_str, get_current_time_str()):
+        # No record for today, inserted new 'In'
+        return "Logged IN automatically for today."
     else:
         # Record exists, and 'Out' is NULL (already logged in)
         return "You are already logged IN for today. Welcome back!"
@@ -93,24 +160,21 @@ def record_manual_in():
     today_str = get_current_date_str()
     current_time_str = get_current_time_str()
 
-    today_record = database_manager.get_attendance_log_by_date(today_str)
-    if today_record:
-        # If record exists, update time_in and clear time_out (as per requirement)
-        database_manager.update_attendance_log_times(today_str, current_time_str, None)
-        return "Manual IN recorded. Previous OUT time cleared if set."
-    else:
-        # No record, insert new
-        database_manager.insert_attendance_log(today_str, current_time_str)
-        return "Manual IN recorded for today."
+    # The insert is skipped when today's record already exists; only then is it
+    # updated (new time_in, time_out cleared as per requirement). One commit for both.
+    with database_manager.transaction():
+        if database_manager.insert_attendance_log(today_str, current_time_str):
+            return "Manual IN recorded for today."
+        database_manager.update_log(today_str, current_time_str, clear_time_out=True)
+    return "Manual IN recorded. Previous OUT time cleared if set."
 
 def record_manual_out():
     """Records a manual 'Out' time for today."""
     today_str = get_current_date_str()
     current_time_str = get_current_time_str()
 
-    today_record = database_manager.get_attendance_log_by_date(today_str)
-    if today_record and today_record['time_in']: # Ensure there's an 'In' to log 'Out' from
-        database_manager.update_attendance_log_out_time(today_str, current_time_str)
+    # Only updates a record that has an 'In' to log 'Out' from
+    if database_manager.close_attendance_log(today_str, current_time_str):
         return "Manual OUT recorded for today."
     else:
         return "Cannot log OUT: No IN time recorded for today."
@@ -123,11 +187,9 @@ def update_attendance_entry(date_str, new_time_in_str, new_time_out_str):
         return "Error: IN time cannot be empty.", False
 
     # Check for valid time format. This is a simple regex check, could be more robust.
-    import re
-    time_pattern = re.compile(r'^\d{2}:\d{2}:\d{2}$')
-    if not time_pattern.match(new_time_in_str):
+    if not _TIME_PATTERN.match(new_time_in_str):
         return "Error: Invalid IN time format. Use HH:MM:SS.", False
-    if new_time_out_str and not time_pattern.match(new_time_out_str):
+    if new_time_out_str and not _TIME_PATTERN.match(new_time_out_str):
         return "Error: Invalid OUT time format. Use HH:MM:SS.", False
 
     try:
@@ -138,240 +200,306 @@ def update_attendance_entry(date_str, new_time_in_str, new_time_out_str):
 
 
 def get_today_attendance_status():
-    """Retrieves and returns the current day's attendance status."""
-    today_str = get_current_date_str()
-    record = database_manager.get_attendance_log_by_date(today_str)
-    return record # Returns sqlite3.Row or None
+    """
+    Retrieves and returns the current day's attendance status.
+    Cheap to call from every GUI refresh: the row comes from get_today()'s cache,
+    which is only re-read after an attendance write or when the date changes.
+    """
+    return get_today()[1] # Returns sqlite3.Row or None
 
 def get_recent_attendance_history(days=30):
     """Fetches attendance logs for the last 'days' for display in history."""
-    today_date_obj = datetime.date.today()
-    start_date_obj = today_date_obj - datetime.timedelta(days=days)
-    
-    start_date_str = start_date_obj.strftime('%Y-%m-%d')
-    end_date_str = today_date_obj.strftime('%Y-%m-%d')
-    
-    return database_manager.get_attendance_logs_in_range(start_date_str, end_date_str)
+    return database_manager.get_attendance_logs_last_n_days(days)
 
 # --- Salary Calculation Logic (NEW FUNCTIONS) ---
 
 def is_weekend(date_obj):
     """Checks if a date is a Saturday (5) or Sunday (6). Monday is 0."""
-    return date_obj.weekday() in [5, 6]
+    return date_obj.weekday() >= 5
 
-def is_public_holiday(date_str):
-    """Checks if a date is a user-defined public holiday."""
-    # We need to fetch all holidays and check if date_str is in them.
-    # For efficiency, a set of holidays in range could be passed, or fetched once.
-    # For now, we'll fetch just for this date.
-    holidays = database_manager.get_holidays_in_range(date_str, date_str)
-    return len(holidays) > 0
-
-def get_daily_pay_and_penalties(log_entry, fixed_salary_per_day,half_day_salary, hourly_rate):
+def is_public_holiday(date_str, holidays_set=None):
     """
-    Calculates the daily pay contribution and penalties for a single day,
-    applying rules 5 (Half Day) and 6 (Hourly Cut).
-    Returns (daily_salary_contribution, is_late_for_cumulative_count, reason_for_penalty_msg).
+    Checks if a date is a user-defined public holiday.
+    Pass holidays_set (any container of YYYY-MM-DD strings, e.g. a dict keyed by date)
+    when the holidays for the period are already loaded to skip the database query.
+    """
+    if holidays_set is not None:
+        return date_str in holidays_set
+    return database_manager.holiday_exists(date_str)
+
+# Day classes for the salary loop, in the precedence order _classify_day checks them
+_DAY_HOLIDAY, _DAY_SUNDAY, _DAY_SATURDAY, _DAY_WORKED, _DAY_ABSENT = range(5)
+
+def _classify_day(is_holiday, dow, log_entry):
+    """Returns the _DAY_* class of a day from its holiday flag, weekday (Monday is 0) and log row."""
+    if is_holiday:
+        return _DAY_HOLIDAY
+    if dow == 6:
+        return _DAY_SUNDAY
+    if dow == 5:
+        return _DAY_SATURDAY
+    if log_entry and log_entry['time_in'] and log_entry['time_out']:
+        return _DAY_WORKED
+    return _DAY_ABSENT
+
+# Days in each month (index 1-12) for a non-leap year
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# IN-time thresholds for the daily pay rules, in seconds since midnight
+_T_1200 = 12 * 3600
+_T_1100 = 11 * 3600
+_T_1000 = 10 * 3600
+_T_0915 = 9 * 3600 + 15 * 60
+
+# Penalty reasons produced by _daily_pay_core, indexed by the reason code it returns
+_ON_TIME, _LATE_AFTER_0915, _LATE_AFTER_10, _LATE_AFTER_11, _HALF_DAY, _INVALID_IN_TIME = range(6)
+_PENALTY_REASONS = (
+    "On Time",
+    "Late (IN after 09:15 AM)",
+    "Late (IN after 10 AM) - 1 hour cut",
+    "Late (IN after 11 AM) - 2 hours cut",
+    "Half Day (Logged IN after 12:00 PM)",
+    "Invalid IN Time Format", # Should be prevented by validation
+)
+
+# Memoized: the result only depends on the arguments, and IN times repeat a lot across days and reports
+@functools.lru_cache(maxsize=4096)
+def _daily_pay_core(in_seconds, fixed_salary_per_day, half_day_salary, hourly_rate):
     """
+    Numeric core of get_daily_pay_and_penalties. Takes the IN time as seconds since
+    midnight (None if it was malformed) and returns (daily_pay, is_late_for_cumulative_count, reason_code).
+    """
+    if in_seconds is None:
+        return 0.0, False, _INVALID_IN_TIME
+
     daily_pay = fixed_salary_per_day
     is_late_for_cumulative_count = False
-    penalty_reason = ""
-
-    if not log_entry or not log_entry['time_in']:
-        # No 'In' log for a working day
-        return 0.0, False, "Absent (No IN Time)"
-
-    time_in_str = log_entry['time_in']
-    
-    # Convert time_in_str to datetime.time object for easier comparison
-    FMT = '%H:%M'
-    try:
-        in_time = datetime.datetime.strptime(time_in_str, FMT).time()
-    except ValueError:
-        return 0.0, False, "Invalid IN Time Format" # Should be prevented by validation
 
     # Rule 5: Log In After 12 PM is Half Day
-    if in_time >= datetime.time(12, 0, 0):
-        daily_pay = half_day_salary
-        return daily_pay, False, "Half Day (Logged IN after 12:00 PM)" # Overrides other rules
+    if in_seconds >= _T_1200:
+        return half_day_salary, False, _HALF_DAY # Overrides other rules
 
     # Rule 6: Log In After 10 AM Hourly Cut
-    elif in_time >= datetime.time(11, 0, 0): # Logged in 11:00 to 11:59 (2 hours cut)
-        hours_to_cut = 2
-        daily_pay -= (hourly_rate * hours_to_cut)
+    elif in_seconds >= _T_1100: # Logged in 11:00 to 11:59 (2 hours cut)
+        daily_pay -= (hourly_rate * 2)
         is_late_for_cumulative_count = True # Still counts as a 'late' instance for Rule 4
-        penalty_reason = f"Late (IN after 11 AM) - {hours_to_cut} hours cut"
-    elif in_time >= datetime.time(10, 0, 0): # Logged in 10:00 to 10:59 (1 hour cut)
-        hours_to_cut = 1
-        daily_pay -= (hourly_rate * hours_to_cut)
+        reason_code = _LATE_AFTER_11
+    elif in_seconds >= _T_1000: # Logged in 10:00 to 10:59 (1 hour cut)
+        daily_pay -= (hourly_rate * 1)
         is_late_for_cumulative_count = True # Still counts as a 'late' instance for Rule 4
-        penalty_reason = f"Late (IN after 10 AM) - {hours_to_cut} hour cut"
+        reason_code = _LATE_AFTER_10
 
     # Rule 4 (Part 1): Late Arrival (after 9:15 AM) - only for cumulative count
-    elif in_time > datetime.time(9, 15, 0):
+    elif in_seconds > _T_0915:
         is_late_for_cumulative_count = True
-        penalty_reason = "Late (IN after 09:15 AM)"
+        reason_code = _LATE_AFTER_0915
     else:
-        penalty_reason = "On Time"
+        reason_code = _ON_TIME
 
     # Ensure daily_pay doesn't go negative
     if daily_pay < 0:
         daily_pay = 0.0
 
-    return daily_pay, is_late_for_cumulative_count, penalty_reason
+    return daily_pay, is_late_for_cumulative_count, reason_code
 
+def _parse_in_seconds(time_in_str):
+    """Converts a stored 'HH:MM' or 'HH:MM:SS' IN time to seconds since midnight, or None if it is malformed."""
+    try:
+        return time_to_seconds(time_in_str)
+    except ValueError:
+        return None
+
+def get_daily_pay_and_penalties(log_entry, fixed_salary_per_day,half_day_salary, hourly_rate):
+    """
+    Calculates the daily pay contribution and penalties for a single day,
+    applying rules 5 (Half Day) and 6 (Hourly Cut).
+    Returns (daily_salary_contribution, is_late_for_cumulative_count, reason_for_penalty_msg).
+    """
+    if not log_entry or not log_entry['time_in']:
+        # No 'In' log for a working day
+        return 0.0, False, "Absent (No IN Time)"
+
+    daily_pay, is_late_for_cumulative_count, reason_code = _daily_pay_core(
+        _parse_in_seconds(log_entry['time_in']), fixed_salary_per_day, half_day_salary, hourly_rate)
+    return daily_pay, is_late_for_cumulative_count, _PENALTY_REASONS[reason_code]
+
+
+# One day of a salary report's "details"; fields are in the GUI's column order
+DailyRow = collections.namedtuple(
+    'DailyRow', 'date status time_in time_out daily_pay_contribution penalty_reason')
 
 def calculate_monthly_salary(report_month=None, report_year=None):
     """
     Calculates the total monthly salary for the current attendance period
     based on all defined rules.
+    Reports are memoized until the logs, holidays or settings change (or the day rolls over).
     """
-    today = 0
     if report_month is None or report_year is None:
-        start_date_str, end_date_str = get_start_end_dates_for_period()
-        today = 1
-    else:
-        report_date = datetime.date(report_year, report_month, 1)
-        start_date_str, end_date_str = get_start_end_dates_for_period(report_date)
-    # Fetch settings
-    fixed_monthly_salary_str = database_manager.get_setting('fixed_monthly_salary')
-    hourly_rate_str = database_manager.get_setting('hourly_rate')
-    fixed_salary_per_day_str = database_manager.get_setting('per_day_salary')
-    half_day_salary_str = database_manager.get_setting('half_day_salary')
-    try:
-        fixed_monthly_salary = float(fixed_monthly_salary_str)
-        hourly_rate = float(hourly_rate_str)
-        fixed_salary_per_day = float(fixed_salary_per_day_str)
-        half_day_salary = float(half_day_salary_str)
-    except (ValueError, TypeError):
-        fixed_monthly_salary = 0.0
-        hourly_rate = 0.0
-        fixed_salary_per_day = 0.0
-        half_day_salary = 0.0
+        report_month = report_year = None
+    report = _calculate_monthly_salary(
+        report_month, report_year, datetime.date.today(),
+        database_manager.get_table_version('attendance_logs'),
+        database_manager.get_table_version('holidays'),
+        database_manager.get_table_version('settings'))
+    # Shallow copy so callers can't alter the cached report; its details are an immutable tuple
+    return dict(report)
+
+@functools.lru_cache(maxsize=32)
+def _calculate_monthly_salary(report_month, report_year, today_date,
+                              logs_version, holidays_version, settings_version):
+    """
+    Computes calculate_monthly_salary's report. The date and table versions are
+    only part of the cache key; the data itself is read from the database.
+    """
+    # Check the salary settings first; the period is only computed once they are known to be valid
+    fixed_monthly_salary, hourly_rate, fixed_salary_per_day, half_day_salary = \
+        _salary_settings(settings_version)
 
     if fixed_monthly_salary == 0 or hourly_rate == 0:
         return {
             "total_salary": 0.0,
-            "details": [],
+            "gross_salary": 0.0,
+            "total_salary_until_today": 0.0,
+            "details": (),
             "summary": "Please set Fixed Monthly Salary and Hourly Rate in settings."
         }
 
-    total_calculated_salary = fixed_monthly_salary
+    today = 0
+    if report_month is None or report_year is None:
+        start_date_str, end_date_str = get_start_end_dates_for_period()
+        today = 1
+    else:
+        report_date = datetime.date(report_year, report_month, 1)
+        start_date_str, end_date_str = get_start_end_dates_for_period(report_date)
 
     # Fetch all logs and holidays for the period
-    all_logs = {log['date']: log for log in database_manager.get_attendance_logs_in_range(start_date_str, end_date_str)}
-    all_holidays = {h['holiday_date']: h['description'] for h in database_manager.get_holidays_in_range(start_date_str, end_date_str)}
+    all_logs, all_holidays = database_manager.get_period_bundle(start_date_str, end_date_str)
 
     
-    daily_breakdown = []
+    daily_breakdown = [] # One DailyRow per day of the period
     
     late_count = 0
     late_amount = 0
     absent_days_count = 0
+    first_absent_index = -1 # Position of the first "Absent" entry in daily_breakdown
     
-    late_deduction_total = 0.0
     actual_working_saturdays = 0
     saturday_holiday = 0
-    gross_salary = 0
-    current_date = datetime.datetime.strptime(start_date_str, '%Y-%m-%d').date()
-    end_date = datetime.datetime.strptime(end_date_str, '%Y-%m-%d').date()
+    # Days are addressed by their offset from the period start
+    start_ordinal = datetime.date.fromisoformat(start_date_str).toordinal()
+    end_ordinal = datetime.date.fromisoformat(end_date_str).toordinal()
+    period_len = end_ordinal - start_ordinal + 1
     total_salary_until_today = 0.0
-    if end_date - current_date >= datetime.timedelta(days=30):
+    if period_len > 30:
         today = 0
     
-    while current_date <= end_date:
-        date_str = current_date.strftime('%Y-%m-%d')
-        log_entry = all_logs.get(date_str)
+    # Lay the fetched logs and holidays out densely, indexed by day offset from the period start
+    log_arr = [None] * period_len
+    for date_key, row in all_logs.items():
+        log_arr[datetime.date.fromisoformat(date_key).toordinal() - start_ordinal] = row
+    hol_arr = [False] * period_len
+    for date_key in all_holidays:
+        hol_arr[datetime.date.fromisoformat(date_key).toordinal() - start_ordinal] = True
+
+    # Classify every day of the period up front; the loop below only switches on the class
+    period_days = []
+    for offset in range(period_len):
+        day = datetime.date.fromordinal(start_ordinal + offset)
+        log_entry = log_arr[offset]
+        dow = day.weekday()
+        # IN times are parsed once here (to seconds); None when there is none or it is malformed
+        in_seconds = _parse_in_seconds(log_entry['time_in']) if log_entry and log_entry['time_in'] else None
+        period_days.append((day.isoformat(), dow, log_entry, in_seconds,
+                            _classify_day(hol_arr[offset], dow, log_entry)))
+
+    for date_str, dow, log_entry, in_seconds, day_class in period_days:
         day_status = "Working Day"
         daily_contribution = 0.0
         late_reason = ""
         is_late_instance = False
-        gross_salary += fixed_salary_per_day 
-        is_holiday = is_public_holiday(date_str)
-        is_sunday = is_weekend(current_date) and current_date.weekday() == 6
-        is_saturday = is_weekend(current_date) and current_date.weekday() == 5
-        
-        
-        if is_holiday:
+
+        if day_class == _DAY_HOLIDAY:
             day_status = f"Paid Day Off (Public Holiday: {all_holidays[date_str]})"
             daily_contribution = fixed_salary_per_day
-            if current_date.weekday() == 5: # Saturday
+            if dow == 5: # Saturday
                 saturday_holiday = 1 # Count this as a holiday Saturday
                 day_status = "Holiday Saturday"
-        elif is_sunday:
+        elif day_class == _DAY_SUNDAY:
             day_status = "Paid Day Off (Sunday)"
             daily_contribution = fixed_salary_per_day
-        elif is_saturday:
+        elif day_class == _DAY_SATURDAY:
             daily_contribution = fixed_salary_per_day
             if log_entry and log_entry['time_in']:
-                daily_contribution, is_late_instance, late_reason = \
-                get_daily_pay_and_penalties(log_entry, fixed_salary_per_day,half_day_salary, hourly_rate)
+                daily_contribution, is_late_instance, reason_code = \
+                _daily_pay_core(in_seconds, fixed_salary_per_day, half_day_salary, hourly_rate)
+                late_reason = _PENALTY_REASONS[reason_code]
                 day_status = "Working Saturday"
                 actual_working_saturdays += 1 # Count this as a worked Saturday
                 if is_late_instance:
                     late_count += 1
-                if "Half Day" in late_reason:
+                if reason_code == _HALF_DAY:
                     day_status = "Half Day"
                     late_amount += daily_contribution
-                elif "Late" in late_reason:
+                elif is_late_instance: # Any of the "Late" reasons
                     day_status = "Working Day (Late)"
                     late_amount += (fixed_salary_per_day - daily_contribution)
                 else:
                     day_status = "Working Day (On Time)"
             else:
                 day_status = "Unlogged Saturday (Pending Rule 2)"
-        elif log_entry and log_entry['time_in'] and log_entry['time_out']:
-            daily_contribution, is_late_instance, late_reason = \
-                get_daily_pay_and_penalties(log_entry, fixed_salary_per_day,half_day_salary, hourly_rate)
+        elif day_class == _DAY_WORKED:
+            daily_contribution, is_late_instance, reason_code = \
+                _daily_pay_core(in_seconds, fixed_salary_per_day, half_day_salary, hourly_rate)
+            late_reason = _PENALTY_REASONS[reason_code]
             
             if is_late_instance:
                 late_count += 1
             
-            if "Half Day" in late_reason:
+            if reason_code == _HALF_DAY:
                 day_status = "Half Day"
                 late_amount += daily_contribution
-            elif "Late" in late_reason:
+            elif is_late_instance: # Any of the "Late" reasons
                 day_status = "Working Day (Late)"
                 late_amount += (fixed_salary_per_day - daily_contribution)
             else:
                 day_status = "Working Day (On Time)"
         else:
+            # _DAY_ABSENT: always a weekday that is not a holiday
             day_status = "Absent"
-            if not is_weekend(current_date) and not is_holiday:
-                absent_days_count += 1
-                daily_contribution = 0.0 # Deduction will be applied later
+            if first_absent_index < 0:
+                first_absent_index = len(daily_breakdown)
+            absent_days_count += 1
+            daily_contribution = 0.0 # Deduction will be applied later
         
-        daily_breakdown.append({
-            "date": date_str,
-            "status": day_status,
-            "in": log_entry['time_in'] if log_entry else 'N/A',
-            "out": log_entry['time_out'] if log_entry else 'N/A',
-            "daily_pay_contribution": round(daily_contribution, 2),
-            "penalty_reason": late_reason
-        })
+        daily_breakdown.append(DailyRow(
+            date_str,
+            day_status,
+            log_entry['time_in'] if log_entry else 'N/A',
+            log_entry['time_out'] if log_entry else 'N/A',
+            round(daily_contribution, 2),
+            late_reason
+        ))
         if today == 1:
             total_salary_until_today += daily_contribution
-        current_date += datetime.timedelta(days=1)
+
+    # Every day of the period counts towards the gross at the fixed daily rate
+    gross_salary = fixed_salary_per_day * len(period_days)
     
     one_paid_day_off_applied = False
+    # Amounts cut from the fixed monthly salary, per rule
+    deductions = {'absent': 0.0, 'late': 0.0, 'saturday': 0.0}
     # --- Apply Post-Iteration Rules ---
     if absent_days_count > 0:
         absent_days_count -= 1
         one_paid_day_off_applied = True
-        # Also need to find the first absent day in the breakdown and update it
-        for i, day_info in enumerate(daily_breakdown):
-            if day_info['status'] == "Absent":
-                daily_breakdown[i]['status'] = "Paid Day Off (Auto Granted)"
-                daily_breakdown[i]['daily_pay_contribution'] = round(fixed_salary_per_day, 2)
-                break
-        absent_deduction_amount = absent_days_count * fixed_salary_per_day
-        total_calculated_salary -= absent_deduction_amount
+        # Also update the first absent day in the breakdown (tracked during the loop)
+        daily_breakdown[first_absent_index] = daily_breakdown[first_absent_index]._replace(
+            status="Paid Day Off (Auto Granted)", daily_pay_contribution=round(fixed_salary_per_day, 2))
+        deductions['absent'] = absent_days_count * fixed_salary_per_day
     
     # Rule 4: Cumulative Late Penalty
     late_deductions_count = late_count // 3
-    late_deduction_amount = (late_deductions_count * fixed_salary_per_day) + late_amount
-    total_calculated_salary -= late_deduction_amount
-    late_deduction_total = late_deduction_amount
+    deductions['late'] = (late_deductions_count * fixed_salary_per_day) + late_amount
 
     # Rule 2: Two Saturdays are paid off, Two Saturdays are worked.
     # We count *worked* Saturdays. If less than 2, apply deduction.
@@ -384,7 +512,6 @@ def calculate_monthly_salary(report_month=None, report_year=None):
     # Rule 1: One additional paid day off per month, handled by app (if user missed a day)
     # Iterate through breakdown to find a candidate for the 'one paid day off'
     # This rule is applied *after* other deductions, if there's a missed working day.
-    saturday_deduction = 0.0
     saturday_reason = ""
     paid_day_off_used_for_saturday = False
     
@@ -392,20 +519,25 @@ def calculate_monthly_salary(report_month=None, report_year=None):
         if not one_paid_day_off_applied:
             paid_day_off_used_for_saturday = True
         missed_saturdays_for_deduction = 2 - actual_working_saturdays - (1 if paid_day_off_used_for_saturday else 0)
-        saturday_deduction = missed_saturdays_for_deduction * fixed_salary_per_day
-        total_calculated_salary -= saturday_deduction
+        deductions['saturday'] = missed_saturdays_for_deduction * fixed_salary_per_day
         saturday_reason = f"Deducted for {missed_saturdays_for_deduction} unlogged Saturday(s) (Expected 2 worked)"
     
     if paid_day_off_used_for_saturday:
         one_paid_day_off_applied = True
+
+    total_calculated_salary = fixed_monthly_salary - sum(deductions.values())
         
     summary = f"Salary calculated for period: {start_date_str} to {end_date_str}\n"
-    summary += f"Total Late Instances: {late_count} ({late_deductions_count} day(s) cut, PKR {late_deduction_total:.2f})\n"
+    summary += f"Total Late Instances: {late_count} ({late_deductions_count} day(s) cut, PKR {deductions['late']:.2f})\n"
     summary += f"Saturdays Worked (not holidays): {actual_working_saturdays} {saturday_reason}\n"
     if one_paid_day_off_applied:
         summary += "One auto-granted paid day off applied.\n"
-    days_in_month = calendar.monthrange(current_date.year, current_date.month)[1]
-    days_in_prev_month = calendar.monthrange(current_date.year, current_date.month - 1)[1]
+    day_after_end = datetime.date.fromordinal(end_ordinal + 1)
+    days_in_month = _days_in_month(day_after_end.year, day_after_end.month)
+    if day_after_end.month == 1:
+        days_in_prev_month = _days_in_month(day_after_end.year - 1, 12)
+    else:
+        days_in_prev_month = _days_in_month(day_after_end.year, day_after_end.month - 1)
     if (days_in_month == 31 or days_in_prev_month == 31) and today == 0:
         gross_salary -= fixed_salary_per_day 
         
@@ -413,7 +545,7 @@ def calculate_monthly_salary(report_month=None, report_year=None):
         "total_salary": round(total_calculated_salary, 2),
         "gross_salary": round(gross_salary, 2),
         "total_salary_until_today": round(total_salary_until_today, 2),
-        "details": daily_breakdown,
+        "details": tuple(daily_breakdown), # Immutable, as reports are cached
         "summary": summary,
         "period_start": start_date_str,
         "period_end": end_date_str
@@ -433,6 +565,13 @@ def delete_log_entry(date):
     database_manager.delete_attendance_log(date)
     return "Log entry deleted successfully."
 
+def delete_log_entries(dates):
+    """Deletes the attendance log entries for several dates at once."""
+    if not dates:
+        return "Error: Date is required."
+    deleted = database_manager.delete_attendance_logs(dates)
+    return f"{deleted} log(s) deleted successfully."
+
 def add_log_entry(date, time_in, time_out):
     """Adds a new attendance log entry to the database."""
     if not all([date, time_in, time_out]):
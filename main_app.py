@@ -1,13 +1,28 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+from tkinter import font as tkfont
 import datetime
 from tkcalendar import DateEntry
 import calendar
+import bisect
+from concurrent.futures import ThreadPoolExecutor
 
 # Import our backend components
 import database_manager
 import logic_manager
 
+# Times offered by the edit-log comboboxes: every 15 minutes from 09:00 to 17:45
+_TIME_LIST = tuple(logic_manager.minutes_to_hhmm(m) for m in range(9 * 60, 18 * 60, 15))
+
+# Month names for the report month combobox (same locale names as strftime('%B'))
+_MONTH_NAMES = list(calendar.month_name)[1:]
+_MONTH_TO_NUM = {name: i + 1 for i, name in enumerate(_MONTH_NAMES)}
+# Report years offered: the last five, this one and the next
+_YEAR_WINDOW = 7
+
+# Logs loaded into the Edit Logs Treeview per page; more are fetched as it is scrolled
+_LOGS_PAGE_SIZE = 50
+
 class AttendanceApp(tk.Tk):
     Time_In = "Time In"
     Time_Out = "Time Out"
@@ -24,6 +39,19 @@ class AttendanceApp(tk.Tk):
         center_y = int((screen_height / 2) - (window_height / 2))
         
         self.geometry(f'{window_width}x{window_height}+{center_x}+{center_y}')
+
+        # Shared fonts, resolved by Tk once rather than for every labelled widget
+        self._h1_font = tkfont.Font(family="Arial", size=14, weight="bold")
+        self._h2_font = tkfont.Font(family="Arial", size=12, weight="bold")
+        self._body_font = tkfont.Font(family="Arial", size=14)
+
+        # One long-lived worker thread for database work that shouldn't block the GUI; it
+        # keeps its own persistent connection (and warm page cache) across jobs
+        self._worker = ThreadPoolExecutor(max_workers=1)
+        # Incremented for every salary calculation started on the worker
+        self._salary_job = 0
+        # Pending after() id of a debounced salary refresh, if any
+        self._salary_refresh_id = None
         
         # Create a Notebook (tabbed interface)
         self.notebook = ttk.Notebook(self)
@@ -49,37 +77,79 @@ class AttendanceApp(tk.Tk):
         # Handle the automatic IN log on startup
         self.after(100, self.handle_startup_log)
 
-        # Initialize the UI components for each tab
+        # Initialize the UI components for the Attendance tab; the other tabs
+        # are set up (and query the database) the first time they are shown
         self.setup_attendance_tab()
-        self.setup_salary_tab()
-        self.setup_settings_tab()
-        self.setup_edit_logs_tab()
-        
-    def _create_time_list(self):
-        """Generates a list of times in 15-minute increments."""
-        times = []
-        for hour in range(9,18):
-            for minute in range(0, 60, 15):
-                times.append(f"{hour:02d}:{minute:02d}")
-        return times
+        self._pending_tab_setups = {
+            str(self.tab_salary): self.setup_salary_tab,
+            str(self.tab_settings): self.setup_settings_tab,
+            str(self.tab_edit): self.setup_edit_logs_tab,
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        
+    def _on_tab_changed(self, event):
+        """Sets up a tab's widgets the first time it is selected."""
+        setup = self._pending_tab_setups.pop(self.notebook.select(), None)
+        if setup is not None:
+            setup()
+
+    def _run_in_background(self, fn, on_done, on_error):
+        """
+        Runs fn() on the worker thread, then calls on_done(result) or on_error(exception)
+        from the Tk loop once it finishes. fn must not touch any widget.
+        """
+        future = self._worker.submit(fn)
+        self.after(50, self._poll_background, future, on_done, on_error)
+
+    def _poll_background(self, future, on_done, on_error):
+        """Checks (from the Tk loop) whether a background job has finished, rescheduling itself if not."""
+        if not future.done():
+            self.after(50, self._poll_background, future, on_done, on_error)
+            return
+        error = future.exception()
+        if error is not None:
+            on_error(error)
+        else:
+            on_done(future.result())
+
     def handle_startup_log(self):
-        """Called after GUI is ready to perform the automatic IN log."""
-        message = logic_manager.handle_app_startup_in_log()
-        self.update_attendance_status()
-        self.update_history_tree()
-        messagebox.showinfo("Auto Log", message)
-        
+        """
+        Called after GUI is ready to perform the automatic IN log. The database work
+        runs on the worker thread; the results are shown once it is done.
+        """
+        def work():
+            message = logic_manager.handle_app_startup_in_log()
+            return (message, logic_manager.get_today_attendance_status(),
+                    logic_manager.get_recent_attendance_history(days=30))
+
+        def done(results):
+            message, record, history = results
+            self._show_attendance_status(record)
+            self._show_history(history)
+            messagebox.showinfo("Auto Log", message)
+
+        def failed(error):
+            messagebox.showerror("Auto Log", f"Automatic IN log failed: {error}")
+
+        self._run_in_background(work, done, failed)
+
     def on_close(self):
         """
         Custom handler for when the user closes the window.
         Logs the OUT time if an IN time exists for today.
         """
+        # Served from logic_manager's cache of today's row; SQLite is only hit for the OUT write
         today_record = logic_manager.get_today_attendance_status()
         if today_record and today_record['time_in'] and today_record['time_out'] is None:
             # Only log OUT if there's an IN time and no OUT time yet
             message = logic_manager.record_manual_out()
             messagebox.showinfo("Log Out", message)
-        
+
+        # Last database use: close the connections so WAL is checkpointed. The worker
+        # closes its own after any job still queued; the interpreter waits for it on exit
+        database_manager.close_connection()
+        self._worker.submit(database_manager.close_connection)
+        self._worker.shutdown(wait=False)
         self.destroy() # Close the application
 
     def setup_attendance_tab(self):
@@ -88,8 +158,8 @@ class AttendanceApp(tk.Tk):
         status_frame = ttk.Frame(self.tab_attendance)
         status_frame.pack(pady=10)
 
-        ttk.Label(status_frame, text="Today's Attendance Status:", font=("Arial", 14, "bold")).pack(side=tk.LEFT, padx=5)
-        self.status_label = ttk.Label(status_frame, text="Fetching...", font=("Arial", 14), foreground="blue")
+        ttk.Label(status_frame, text="Today's Attendance Status:", font=self._h1_font).pack(side=tk.LEFT, padx=5)
+        self.status_label = ttk.Label(status_frame, text="Fetching...", font=self._body_font, foreground="blue")
         self.status_label.pack(side=tk.LEFT, padx=5)
 
         # --- UI for Log In/Out buttons ---
@@ -103,7 +173,7 @@ class AttendanceApp(tk.Tk):
         history_frame = ttk.Frame(self.tab_attendance)
         history_frame.pack(expand=True, fill="both", padx=10, pady=10)
 
-        ttk.Label(history_frame, text="Attendance History:", font=("Arial", 12, "bold")).pack(pady=5)
+        ttk.Label(history_frame, text="Attendance History:", font=self._h2_font).pack(pady=5)
         
         # Create a Treeview for history display
         columns = ("Date", self.Time_In, self.Time_Out)
@@ -118,9 +188,7 @@ class AttendanceApp(tk.Tk):
         scrollbar = ttk.Scrollbar(history_frame, orient="vertical", command=self.history_tree.yview)
         self.history_tree.configure(yscrollcommand=scrollbar.set)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        self.update_attendance_status()
-        self.update_history_tree()
+        # The status and history are filled in by handle_startup_log once the window is up
 
     def setup_salary_tab(self):
         """Sets up the UI for the Salary Report tab."""
@@ -134,16 +202,19 @@ class AttendanceApp(tk.Tk):
         
         ttk.Label(period_control_frame, text="Select Report Month:").pack(side=tk.LEFT, padx=5)
         
-        self.months = [datetime.date(2000, i, 1).strftime('%B') for i in range(1, 13)]
+        today = datetime.date.today()
+        self.months = _MONTH_NAMES
+        self._month_to_num = _MONTH_TO_NUM
         self.month_combo = ttk.Combobox(period_control_frame, values=self.months, state="readonly", width=12)
-        self.month_combo.set(datetime.date.today().strftime('%B'))
+        self.month_combo.set(_MONTH_NAMES[today.month - 1])
         self.month_combo.pack(side=tk.LEFT, padx=5)
         
         ttk.Label(period_control_frame, text="Year:").pack(side=tk.LEFT, padx=5)
         
-        current_year = datetime.date.today().year
-        self.years = list(range(current_year - 5, current_year + 2))
-        self.year_combo = ttk.Combobox(period_control_frame, values=[str(year) for year in self.years], state="readonly", width=8)
+        current_year = today.year
+        self.years = list(range(current_year - 5, current_year - 5 + _YEAR_WINDOW))
+        self._years_str = [str(year) for year in self.years]
+        self.year_combo = ttk.Combobox(period_control_frame, values=self._years_str, state="readonly", width=8)
         self.year_combo.set(current_year)
         self.year_combo.pack(side=tk.LEFT, padx=5)
 
@@ -199,81 +270,98 @@ class AttendanceApp(tk.Tk):
         Calculates the salary for the current month up to today and displays the report.
         This is a convenience method for quick calculations without needing to select month/year.
         """
-        # Clear previous report
-        self.summary_text.config(state='normal')
-        self.summary_text.delete('1.0', tk.END)
-        for item in self.details_tree.get_children():
-            self.details_tree.delete(item)
-            
-        report = logic_manager.calculate_monthly_salary()
-         # Populate summary text
-        summary_text = f"Total Salary Until Today: PKR {report['total_salary_until_today']:.2f}\n"
-        summary_text += f"Gross Salary (without deductions): PKR {report['gross_salary']:.2f}\n\n"
-        
-        if "Please set" in report['summary']:
-            messagebox.showwarning("Settings Missing", "Please ensure Fixed Monthly Salary and Hourly Rate are set in the Settings tab.")
-
-        summary_text += report['summary']
-        
-        self.summary_text.insert(tk.END, summary_text)
-        self.summary_text.config(state='disabled')
-
-        # Populate daily breakdown Treeview
-        for day in report['details']:
-            self.details_tree.insert("", tk.END, values=(
-                day['date'],
-                day['status'],
-                day['in'],
-                day['out'],
-                day['daily_pay_contribution'],
-                day['penalty_reason']
-            ))
+        self._start_salary_calculation("Total Salary Until Today", 'total_salary_until_today')
         
     def calculate_and_show_salary(self):
         """
         Calculates the monthly salary and displays the report on the Salary tab.
         """
-        # Clear previous report
-        self.summary_text.config(state='normal')
-        self.summary_text.delete('1.0', tk.END)
-        for item in self.details_tree.get_children():
-            self.details_tree.delete(item)
-
         # Get selected month and year from comboboxes
         try:
             selected_month_name = self.month_combo.get()
             selected_year = int(self.year_combo.get())
-            selected_month = self.months.index(selected_month_name) + 1
-            print(f"Calculating salary for {selected_month_name} {selected_year}")
-        except (ValueError, IndexError):
+            selected_month = self._month_to_num[selected_month_name]
+        except (ValueError, KeyError):
             messagebox.showerror("Error", "Please select a valid month and year.")
             return
 
         # Call the logic manager with the selected period
-        report = logic_manager.calculate_monthly_salary(report_month=selected_month, report_year=selected_year)
-        
-        # Populate summary text
-        summary_text = f"Total Calculated Salary: PKR {report['total_salary']:.2f}\n"
-        summary_text += f"Gross Salary (without deductions): PKR {report['gross_salary']:.2f}\n\n"
-        
+        self._start_salary_calculation("Total Calculated Salary", 'total_salary',
+                                       report_month=selected_month, report_year=selected_year)
+
+    def schedule_salary_refresh(self, delay_ms=300):
+        """
+        Recalculates the salary report after a short delay. Calls made within the
+        delay (e.g. several edits in a row) collapse into a single recalculation.
+        """
+        if self._salary_refresh_id is not None:
+            self.after_cancel(self._salary_refresh_id)
+        self._salary_refresh_id = self.after(delay_ms, self._run_salary_refresh)
+
+    def _run_salary_refresh(self):
+        self._salary_refresh_id = None
+        # Nothing to refresh until the Salary Report tab has been set up
+        if str(self.tab_salary) not in self._pending_tab_setups:
+            self.calculate_and_show_salary()
+
+    def _start_salary_calculation(self, total_label, total_key, **period):
+        """
+        Runs logic_manager.calculate_monthly_salary(**period) on the worker thread so the
+        GUI stays responsive, then renders the report once it is ready.
+        """
+        # Clear previous report
+        self._set_summary_text("Calculating...")
+        self.details_tree.delete(*self.details_tree.get_children())
+        self.calculate_button.config(state='disabled')
+        self.today_button.config(state='disabled')
+
+        # Only the latest request gets rendered if several overlap
+        self._salary_job += 1
+        job = self._salary_job
+
+        def done(report):
+            if self._finish_salary_job(job):
+                self._render_salary_report(report, total_label, total_key)
+
+        def failed(error):
+            if self._finish_salary_job(job):
+                self._set_summary_text("")
+                messagebox.showerror("Error", f"Salary calculation failed: {error}")
+
+        self._run_in_background(lambda: logic_manager.calculate_monthly_salary(**period), done, failed)
+
+    def _finish_salary_job(self, job):
+        """Re-enables the salary buttons for the latest job; returns False for a superseded one."""
+        if job != self._salary_job:
+            return False # A newer calculation has been started since
+        self.calculate_button.config(state='normal')
+        self.today_button.config(state='normal')
+        return True
+
+    def _set_summary_text(self, text):
+        """Replaces the contents of the read-only summary box."""
+        self.summary_text.config(state='normal')
+        self.summary_text.delete('1.0', tk.END)
+        if text:
+            self.summary_text.insert(tk.END, text)
+        self.summary_text.config(state='disabled')
+
+    def _render_salary_report(self, report, total_label, total_key):
+        """Fills the summary text and the daily breakdown Treeview from a salary report."""
         if "Please set" in report['summary']:
             messagebox.showwarning("Settings Missing", "Please ensure Fixed Monthly Salary and Hourly Rate are set in the Settings tab.")
 
-        summary_text += report['summary']
-        
-        self.summary_text.insert(tk.END, summary_text)
-        self.summary_text.config(state='disabled')
+        # Populate summary text
+        self._set_summary_text("".join((
+            f"{total_label}: PKR {report[total_key]:.2f}\n",
+            f"Gross Salary (without deductions): PKR {report['gross_salary']:.2f}\n\n",
+            report['summary'],
+        )))
 
         # Populate daily breakdown Treeview
+        # Each DailyRow's fields are already in column order
         for day in report['details']:
-            self.details_tree.insert("", tk.END, values=(
-                day['date'],
-                day['status'],
-                day['in'],
-                day['out'],
-                day['daily_pay_contribution'],
-                day['penalty_reason']
-            ))
+            self.details_tree.insert("", tk.END, values=day)
 
     def setup_settings_tab(self):
         """Sets up the UI for the Settings tab."""
@@ -358,9 +446,10 @@ class AttendanceApp(tk.Tk):
         # Delete button for holidays
         delete_holiday_button = ttk.Button(holidays_frame, text="Delete Selected Holiday", command=self.delete_holiday)
         delete_holiday_button.pack(pady=5)
-        
-        self.load_settings()
-        self.load_holidays()
+
+        # Fill the entries and holiday list after the tab's first layout pass
+        self.after_idle(self.load_settings)
+        self.after_idle(self.load_holidays)
 
     def setup_edit_logs_tab(self):
         """Sets up the UI for the Edit Logs tab."""
@@ -394,13 +483,13 @@ class AttendanceApp(tk.Tk):
         ttk.Label(controls_frame, text="Time In:").pack(side=tk.LEFT, padx=5)
         self.edit_time_in_var = tk.StringVar()
         self.edit_time_in_combo = ttk.Combobox(controls_frame, textvariable=self.edit_time_in_var, width=8, state="readonly")
-        self.edit_time_in_combo['values'] = self._create_time_list()
+        self.edit_time_in_combo['values'] = _TIME_LIST
         self.edit_time_in_combo.pack(side=tk.LEFT, padx=5)
 
         ttk.Label(controls_frame, text="Time Out:").pack(side=tk.LEFT, padx=5)
         self.edit_time_out_var = tk.StringVar()
         self.edit_time_out_combo = ttk.Combobox(controls_frame, textvariable=self.edit_time_out_var, width=8, state="readonly")
-        self.edit_time_out_combo['values'] = self._create_time_list()
+        self.edit_time_out_combo['values'] = _TIME_LIST
         self.edit_time_out_combo.pack(side=tk.LEFT, padx=5)
         
         self.edit_button = ttk.Button(controls_frame, text="Update Log", command=self.update_log_entry)
@@ -423,6 +512,13 @@ class AttendanceApp(tk.Tk):
 
         # Bind a click event to the Treeview to load selected log into entry fields
         self.logs_treeview.bind("<<TreeviewSelect>>", self.on_log_select)
+
+        # Paging state for the logs Treeview, reset by populate_logs_treeview
+        self._logs_range = None
+        self._logs_last_date = None
+        self._logs_exhausted = True
+        self._logs_loading = False
+        self.logs_treeview.configure(yscrollcommand=self._on_logs_scroll)
         
         # Set default values for the date range
         today = datetime.date.today()
@@ -454,9 +550,10 @@ class AttendanceApp(tk.Tk):
         
     def populate_logs_treeview(self):
         """Fetches and populates the logs Treeview based on the specified date range."""
-        for item in self.logs_treeview.get_children():
-            self.logs_treeview.delete(item)
-            
+        self.logs_treeview.delete(*self.logs_treeview.get_children())
+        # ISO date of each row id, filled as pages are inserted
+        self._log_iid_to_date = {}
+
         start_date_str = self.log_start_date_var.get()
         end_date_str = self.log_end_date_var.get()
 
@@ -465,15 +562,44 @@ class AttendanceApp(tk.Tk):
             datetime.datetime.strptime(start_date_str, '%Y-%m-%d')
             datetime.datetime.strptime(end_date_str, '%Y-%m-%d')
         except ValueError:
+            # Nothing more to page in; the cleared tree would otherwise pull the previous range's next page
+            self._logs_exhausted = True
             messagebox.showwarning("Invalid Date Format", "Please use YYYY-MM-DD format for dates.")
             return
 
-        logs = database_manager.get_attendance_logs_in_range_for_edittab(start_date_str, end_date_str)
+        # Only the first page is loaded now; _on_logs_scroll fetches the rest on demand
+        self._logs_range = (start_date_str, end_date_str)
+        self._logs_last_date = None
+        self._logs_exhausted = False
+        self._load_more_logs()
+
+    def _load_more_logs(self):
+        """Appends the next page of logs for the current date range to the logs Treeview."""
+        self._logs_loading = False
+        if self._logs_exhausted:
+            return
+        start_date_str, end_date_str = self._logs_range
+        logs = database_manager.get_attendance_logs_in_range_for_edittab(
+            start_date_str, end_date_str, _LOGS_PAGE_SIZE, self._logs_last_date)
         for log in logs:
-            date_obj = datetime.datetime.strptime(log['date'], "%Y-%m-%d")
+            date_obj = datetime.date.fromisoformat(log['date'])
             # Format as "Monday, September 1, 2025"
             formatted_date = date_obj.strftime("%A, %B %d, %Y")
-            self.logs_treeview.insert("", tk.END, values=(formatted_date, log['time_in'], log['time_out']))
+            iid = self.logs_treeview.insert("", tk.END, values=(formatted_date, log['time_in'], log['time_out']))
+            self._log_iid_to_date[iid] = log['date']
+        if len(logs) < _LOGS_PAGE_SIZE:
+            self._logs_exhausted = True
+        else:
+            self._logs_last_date = logs[-1]['date']
+
+    def _on_logs_scroll(self, first, last):
+        """
+        yscrollcommand of the logs Treeview. Schedules the next page once the view
+        nears the bottom (or still isn't full), so only about a screenful is loaded.
+        """
+        if float(last) > 0.9 and not self._logs_exhausted and not self._logs_loading:
+            self._logs_loading = True
+            self.after_idle(self._load_more_logs)
         
         
     def delete_log_entry(self):
@@ -485,20 +611,17 @@ class AttendanceApp(tk.Tk):
 
         confirmation_message = f"Are you sure you want to delete {len(selected_items)} selected log(s)?"
         if messagebox.askyesno("Confirm Deletion", confirmation_message):
-            dates_to_delete = []
-            for item in selected_items:
-                date = self.logs_treeview.item(item, 'values')[0]
-                date_obj = datetime.datetime.strptime(date, "%A, %B %d, %Y").date()
-                dates_to_delete.append(date_obj)
+            dates_to_delete = [self._log_iid_to_date[item] for item in selected_items]
 
-            for date in dates_to_delete:
-                logic_manager.delete_log_entry(date)
-            
-            messagebox.showinfo("Delete Status", f"{len(selected_items)} log(s) deleted successfully.")
+            # All selected logs go in one transaction
+            result = logic_manager.delete_log_entries(dates_to_delete)
+            messagebox.showinfo("Delete Status", result)
             
-            # Refresh the Treeview and the Salary Report
-            self.populate_logs_treeview()
-            self.calculate_and_show_salary()
+            # Drop the deleted rows from the Treeview and refresh the Salary Report
+            self.logs_treeview.delete(*selected_items)
+            for item in selected_items:
+                del self._log_iid_to_date[item]
+            self.schedule_salary_refresh()
 
 
     def on_log_select(self, event):
@@ -531,15 +654,29 @@ class AttendanceApp(tk.Tk):
             messagebox.showwarning("Incomplete Data", "Date, Time In, and Time Out must all be filled.")
             return
 
+        selected_item = self.logs_treeview.focus()
         result = logic_manager.update_log_entry(date, time_in, time_out)
         messagebox.showinfo("Update Status", result)
-        self.populate_logs_treeview()
-        self.calculate_and_show_salary() # Recalculate salary to reflect changes
+
+        # Patch the selected row in place when it is the one that was edited;
+        # otherwise (another date) reload the list so the right row shows the change
+        try:
+            formatted_date = datetime.date.fromisoformat(date).strftime("%A, %B %d, %Y")
+        except ValueError:
+            formatted_date = None
+        if formatted_date and selected_item and self.logs_treeview.item(selected_item, 'values')[0] == formatted_date:
+            self.logs_treeview.item(selected_item, values=(formatted_date, time_in, time_out))
+        else:
+            self.populate_logs_treeview()
+        self.schedule_salary_refresh() # Recalculate salary to reflect changes
 
 
     def update_attendance_status(self):
         """Updates the status label on the Attendance tab."""
-        record = logic_manager.get_today_attendance_status()
+        self._show_attendance_status(logic_manager.get_today_attendance_status())
+
+    def _show_attendance_status(self, record):
+        """Shows today's log record (or None) in the status label."""
         if record:
             self.status_label.config(text=f"Logged IN at {record['time_in']}", foreground="green")
         else:
@@ -547,12 +684,13 @@ class AttendanceApp(tk.Tk):
 
     def update_history_tree(self):
         """Fetches recent history and populates the Treeview."""
-        # Clear existing entries
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
-
         # Get records from the logic manager and insert into the Treeview
-        history = logic_manager.get_recent_attendance_history(days=30)
+        self._show_history(logic_manager.get_recent_attendance_history(days=30))
+
+    def _show_history(self, history):
+        """Replaces the history Treeview's rows with the given log records."""
+        # Clear existing entries
+        self.history_tree.delete(*self.history_tree.get_children())
         for record in history:
             self.history_tree.insert("", tk.END, values=(record['date'], record['time_in'], record['time_out'] if record['time_out'] else 'N/A'))
 
@@ -572,18 +710,19 @@ class AttendanceApp(tk.Tk):
         
     def load_settings(self):
         """Loads settings from the database and populates the entry fields."""
-        self.salary_entry.delete(0, tk.END)
-        self.salary_entry.insert(0, database_manager.get_setting('fixed_monthly_salary'))
-        self.rate_entry.delete(0, tk.END)
-        self.rate_entry.insert(0, database_manager.get_setting('hourly_rate'))
-        self.month_start_entry.delete(0, tk.END)
-        self.month_start_entry.insert(0, database_manager.get_setting('month_start_day'))
-        self.month_end_entry.delete(0, tk.END)
-        self.month_end_entry.insert(0, database_manager.get_setting('month_end_day'))
-        self.day_salary_entry.delete(0, tk.END)
-        self.day_salary_entry.insert(0, database_manager.get_setting('per_day_salary'))
-        self.half_day_salary_label_entry.delete(0, tk.END)
-        self.half_day_salary_label_entry.insert(0, database_manager.get_setting('half_day_salary'))
+        entries = {
+            'fixed_monthly_salary': self.salary_entry,
+            'hourly_rate': self.rate_entry,
+            'month_start_day': self.month_start_entry,
+            'month_end_day': self.month_end_entry,
+            'per_day_salary': self.day_salary_entry,
+            'half_day_salary': self.half_day_salary_label_entry,
+        }
+        # Fetch all six values in one call
+        settings = database_manager.get_settings(entries)
+        for key, entry in entries.items():
+            entry.delete(0, tk.END)
+            entry.insert(0, settings[key])
         
 
     def update_settings(self):
@@ -607,32 +746,36 @@ class AttendanceApp(tk.Tk):
             messagebox.showerror("Error", "Please enter valid numbers for settings.")
             return
 
-        database_manager.update_setting('fixed_monthly_salary', str(fixed_salary))
-        database_manager.update_setting('hourly_rate', str(hourly_rate))
-        database_manager.update_setting('month_start_day', str(month_start))
-        database_manager.update_setting('month_end_day', str(month_end))
-        database_manager.update_setting('per_day_salary', str(per_day_salary))
-        database_manager.update_setting('half_day_salary', str(half_day_salary))
+        database_manager.update_settings({
+            'fixed_monthly_salary': fixed_salary,
+            'hourly_rate': hourly_rate,
+            'month_start_day': month_start,
+            'month_end_day': month_end,
+            'per_day_salary': per_day_salary,
+            'half_day_salary': half_day_salary,
+        })
         messagebox.showinfo("Success", "Settings updated successfully!")
 
     def load_holidays(self):
         """Loads holidays from the database and populates the Treeview."""
         # Clear existing entries
-        for item in self.holiday_tree.get_children():
-            self.holiday_tree.delete(item)
+        self.holiday_tree.delete(*self.holiday_tree.get_children())
 
-        # Get all holidays for the next year (to cover any period)
+        # Get all holidays for the current month
         today = datetime.date.today()
         first_day = today.replace(day=1)
         last_day = datetime.date(today.year, today.month, calendar.monthrange(today.year, today.month)[1])
-        holidays = database_manager.get_holidays_in_range(first_day.strftime('%Y-%m-%d'), last_day.strftime('%Y-%m-%d'))
-        
+        self._holiday_range = (first_day.isoformat(), last_day.isoformat())
+        holidays = database_manager.get_holidays_in_range(*self._holiday_range)
+
+        # Row id per displayed date, so adds and deletes can patch the tree in place
+        self._holiday_rows = {}
         for h in holidays:
-            self.holiday_tree.insert("", tk.END, values=(h['holiday_date'], h['description']))
+            self._holiday_rows[h['holiday_date']] = self.holiday_tree.insert("", tk.END, values=(h['holiday_date'], h['description']))
             
     def add_holiday(self):
         """Adds a new holiday to the database."""
-        holiday_date = self.holiday_date_entry.get_date().strftime('%Y-%m-%d')
+        holiday_date = self.holiday_date_entry.get_date().isoformat()
         description = self.holiday_desc_entry.get()
         
         if not holiday_date:
@@ -651,7 +794,11 @@ class AttendanceApp(tk.Tk):
             messagebox.showinfo("Success", "Holiday added successfully!")
             self.holiday_date_entry.delete(0, tk.END)
             self.holiday_desc_entry.delete(0, tk.END)
-            self.load_holidays() # Refresh the treeview
+            # Only a holiday in the displayed month needs a row, inserted in date order
+            first_day, last_day = self._holiday_range
+            if first_day <= holiday_date <= last_day:
+                index = bisect.bisect(sorted(self._holiday_rows), holiday_date)
+                self._holiday_rows[holiday_date] = self.holiday_tree.insert("", index, values=(holiday_date, description))
         else:
             messagebox.showerror("Error", "Holiday for this date already exists.")
             
@@ -668,7 +815,8 @@ class AttendanceApp(tk.Tk):
         if messagebox.askyesno("Confirm Deletion", f"Are you sure you want to delete the holiday on {selected_date}?"):
             database_manager.delete_holiday(selected_date)
             messagebox.showinfo("Success", "Holiday deleted successfully.")
-            self.load_holidays()  # Refresh the treeview
+            self.holiday_tree.delete(selected_item)
+            self._holiday_rows.pop(selected_date, None)
 
 
 if __name__ == "__main__":